@@ -1,7 +1,9 @@
 """Helios Cinema integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import timedelta
 from typing import Any
 
 import voluptuous as vol
@@ -9,12 +11,20 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv, discovery
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .scraper import HeliosScraper
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "helios_cinema"
 PLATFORMS = [Platform.SENSOR]
 
+STORAGE_KEY = f"{DOMAIN}_cache"
+STORAGE_VERSION = 1
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -29,6 +39,56 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+class HeliosCinemaCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, Any]]]]):
+    """Fetch films for all configured cinemas in one concurrent poll."""
+
+    def __init__(self, hass: HomeAssistant, cinema_urls: list[str], update_interval: int) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(minutes=update_interval),
+        )
+        session = async_get_clientsession(hass)
+        self._scrapers = {
+            url: HeliosScraper(url, timeout=30, session=session) for url in cinema_urls
+        }
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._cache_restored = False
+        self._saved_cache: dict[str, dict[str, Any]] | None = None
+
+    async def _async_update_data(self) -> dict[str, list[dict[str, Any]]]:
+        """Fetch films for every cinema concurrently, keyed by cinema URL."""
+        # Seed the scrapers with the validators and films saved before a restart
+        if not self._cache_restored:
+            cache = await self._store.async_load() or {}
+            for url, scraper in self._scrapers.items():
+                if url in cache:
+                    scraper.restore_cache(cache[url])
+            self._saved_cache = cache
+            self._cache_restored = True
+
+        results = await asyncio.gather(
+            *(scraper.get_films() for scraper in self._scrapers.values()),
+            return_exceptions=True,
+        )
+
+        data = {}
+        for url, result in zip(self._scrapers, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error fetching films for %s: %s", url, result)
+                result = (self.data or {}).get(url, [])
+            data[url] = result
+
+        # Unchanged pages (304s, identical bodies) leave nothing new to write
+        cache = {url: scraper.cache for url, scraper in self._scrapers.items()}
+        if cache != self._saved_cache:
+            await self._store.async_save(cache)
+            self._saved_cache = cache
+        return data
+
+
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the Helios Cinema component."""
     hass.data.setdefault(DOMAIN, {})
@@ -7,45 +7,425 @@ It can extract movie titles, descriptions, images, and showtimes from the websit
 """
 
 import re
+import json
+import hashlib
+import functools
+import string
 import asyncio
+import logging
 import aiohttp
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import Any, Iterator, List, Dict, Optional, Tuple
+from lxml import etree
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Common headings, CSS classes and data attributes holding movie titles
+_FALLBACK_TITLE_TAGS = frozenset(['h2', 'h3', 'h4'])
+_FALLBACK_TITLE_CLASSES = frozenset(['movie-title', 'film-title'])
+_FALLBACK_MARKERS = ('<h2', '<h3', '<h4', 'movie-title', 'film-title', 'data-title')
+
+# Start of the window.__NUXT__ IIFE emitted by Nuxt server-side rendering
+_NUXT_MARKER = 'window.__NUXT__=(function('
+
+# Tokens of the NUXT payload: string literals, numbers, identifiers, punctuation.
+# String literals use the unrolled form so runs of plain characters are
+# consumed in one step without per-character alternation or backtracking.
+_JS_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?|[A-Za-z_$][\w$]*|\S')
+
+# NUXT timeFrom values ("2025-07-18 20:00:00"), capturing HH:MM
+_DATE_TIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} (\d{2}:\d{2}):\d{2}')
+
+_JS_CONSTANTS = {'true': True, 'false': False, 'null': None}
+
+# Strings that are site paths, image names or asset paths rather than movie
+# titles; the path prefixes are matched case-sensitively
+_REJECT_TITLE_RE = re.compile(
+    r'(?-i:^(?:film|wydarzenie)/)|plakat|duzy-obraz|poster|banner|slug|\.(?:jpe?g|png)$',
+    re.IGNORECASE,
+)
+
+# Keywords a heading must contain to count as a movie in the HTML fallback
+_FALLBACK_KEYWORD_RE = re.compile(r'superman|basia|smerfy|harry|film|maraton', re.IGNORECASE)
+
+# Slug character mapping: drop punctuation, treat hyphens as word breaks and
+# fold Polish diacritics the way helios.pl URLs do (ł -> l, ś -> s, ...)
+_SLUG_TABLE = str.maketrans({
+    **{c: None for c in string.punctuation.replace('-', '')},
+    '-': ' ',
+    **dict(zip('ąćęłńóśźż', 'acelnoszz')),
+})
+
+
+class _NuxtPayload:
+    """
+    Minimal evaluator for the window.__NUXT__ payload.
+    
+    Nuxt serializes its state as
+    ``(function(a,b,...){a.x=b;...;return {...}}(arg1,arg2,...))``.
+    The arguments are JSON apart from a few JS idioms (``void 0``,
+    ``Array(n)``) and the body only holds literals, variable references and
+    property assignments, so it can be evaluated without a JS engine.
+    """
+    
+    def __init__(self, script: str):
+        """
+        Tokenize the payload.
+        
+        Args:
+            script: Script text starting at window.__NUXT__
+        """
+        self._tokens = _JS_TOKEN_RE.findall(script)
+        self._pos = 0
+        self._scope: Dict[str, Any] = {}
+    
+    def evaluate(self) -> Any:
+        """
+        Evaluate the payload.
+        
+        Returns:
+            The NUXT state as plain Python dicts and lists
+        """
+        tokens = self._tokens
+        params_start = tokens.index('(', tokens.index('function'))
+        body_start = tokens.index('{', params_start)
+        names = [t for t in tokens[params_start + 1:body_start - 1] if t != ',']
+        
+        # Skip over the function body to read the call arguments first
+        depth = 0
+        for body_end in range(body_start, len(tokens)):
+            if tokens[body_end] == '{':
+                depth += 1
+            elif tokens[body_end] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        # Only the Nuxt form, with the call inside the outer parentheses
+        if tokens[body_end + 1:body_end + 2] != ['(']:
+            raise ValueError("Unsupported NUXT payload form")
+        self._pos = body_end + 2
+        self._scope = dict(zip(names, self._sequence(')')))
+        
+        self._pos = body_start + 1
+        while self._pos < body_end:
+            token = self._next()
+            if token == 'return':
+                return self._value()
+            if token != ';':
+                self._assign(self._scope.get(token))
+        return None
+    
+    def _next(self) -> str:
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+    
+    def _assign(self, target: Any) -> None:
+        """Evaluate a statement like ``a.b[0].c=value`` on target."""
+        while True:
+            if self._next() == '.':
+                key = self._next()
+            else:
+                key = int(self._next())
+                self._next()  # ']'
+            if self._tokens[self._pos] == '=':
+                break
+            target = target[key]
+        self._pos += 1
+        value = self._value()
+        if isinstance(target, list) and key >= len(target):
+            target.extend([None] * (key + 1 - len(target)))
+        target[key] = value
+    
+    def _sequence(self, closing: str) -> List[Any]:
+        items = []
+        while self._tokens[self._pos] != closing:
+            items.append(self._value())
+            if self._tokens[self._pos] == ',':
+                self._pos += 1
+        self._pos += 1
+        return items
+    
+    def _value(self) -> Any:
+        token = self._next()
+        if token == '{':
+            obj = {}
+            while self._tokens[self._pos] != '}':
+                key = self._next()
+                if key[0] == '"':
+                    key = json.loads(key)
+                self._pos += 1  # ':'
+                obj[key] = self._value()
+                if self._tokens[self._pos] == ',':
+                    self._pos += 1
+            self._pos += 1
+            return obj
+        if token == '[':
+            return self._sequence(']')
+        if token[0] == '"' or token[0].isdigit() or token[0] == '-':
+            return json.loads(token)
+        if token in _JS_CONSTANTS:
+            return _JS_CONSTANTS[token]
+        if token == 'void':
+            self._pos += 1
+            return None
+        if token == 'Array':
+            self._pos += 1  # '('
+            return [None] * int(self._sequence(')')[0])
+        if token == 'new':
+            # e.g. new Date(...): keep the constructor argument
+            self._pos += 2
+            args = self._sequence(')')
+            return args[0] if args else None
+        if not (token[0].isalpha() or token[0] in '_$'):
+            raise ValueError(f"Unexpected token in NUXT payload: {token!r}")
+        return self._scope.get(token)
+
+
+def _iter_dicts(root: Any) -> Iterator[Dict]:
+    """
+    Yield every dict reachable from root in document order, each shared object only once.
+    
+    Args:
+        root: Evaluated NUXT state
+        
+    Returns:
+        Iterator over dictionaries
+    """
+    seen = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _iter_html_events(html: str, chunk_size: int = 65536) -> Iterator[tuple]:
+    """
+    Stream start/end events for an HTML page through lxml's C parser.
+    
+    The text is fed in chunks as-is, without re-encoding the page to bytes
+    first, and events are handed out while the rest is still unparsed.
+    
+    Args:
+        html: HTML content as string
+        chunk_size: Number of characters fed to the parser at a time
+        
+    Returns:
+        Iterator over (event, element) pairs
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'))
+    for offset in range(0, len(html), chunk_size):
+        parser.feed(html[offset:offset + chunk_size])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _is_title_element(element: Any) -> bool:
+    """
+    Check whether an HTML element may hold a movie title.
+    
+    Args:
+        element: lxml element
+        
+    Returns:
+        True for h2-h4 headings, movie/film title classes and data-title attributes
+    """
+    if element.tag in _FALLBACK_TITLE_TAGS or 'data-title' in element.attrib:
+        return True
+    classes = element.get('class')
+    # Cheap substring probe first; only split the few candidates into tokens
+    if not classes or '-title' not in classes:
+        return False
+    return not _FALLBACK_TITLE_CLASSES.isdisjoint(classes.split())
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_title(title: str) -> bool:
+    """
+    Filter out paths, image names and other non-title strings.
+    
+    Args:
+        title: Candidate movie title
+        
+    Returns:
+        True if the string looks like a movie title
+    """
+    # Cheapest checks first. Titles come from structurally matched movie
+    # dicts, so single-word titles (F1, Elio) are allowed; the old length and
+    # word-count heuristic is no longer needed.
+    if len(title) <= 1 or len(title) >= 100:
+        return False
+    return not _REJECT_TITLE_RE.search(title)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_fallback_title(text: str) -> bool:
+    """
+    Check whether a heading text from the HTML fallback looks like a movie title.
+    
+    Args:
+        text: Heading text
+        
+    Returns:
+        True if the text should be treated as a movie title
+    """
+    return len(text) > 5 and len(text) < 100 and bool(_FALLBACK_KEYWORD_RE.search(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _slugify(text: str) -> str:
+    """
+    Convert text to URL-friendly slug.
+    
+    Titles repeat from poll to poll, so results are memoized.
+    
+    Args:
+        text: Text to convert
+        
+    Returns:
+        URL-friendly slug
+    """
+    # Any other non-ASCII characters are dropped
+    slug = text.lower().translate(_SLUG_TABLE).encode('ascii', 'ignore').decode('ascii')
+    return '-'.join(slug.split())
 
 
 class HeliosScraper:
     """Scraper for Helios Cinema websites."""
     
-    def __init__(self, cinema_url: str, timeout: int = 30):
+    def __init__(self, cinema_url: str, timeout: int = 30,
+                 session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the scraper.
         
         Args:
             cinema_url: URL of the Helios cinema location
             timeout: HTTP request timeout in seconds
+            session: Shared aiohttp session to reuse; if omitted, the scraper
+                creates its own on first use and closes it in close()
         """
         self.cinema_url = cinema_url
         self.timeout = timeout
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        
+        # Validators and result of the last successfully parsed fetch
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._html_digest: Optional[bytes] = None
+        self._films: List[Dict] = []
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the HTTP session, creating an owned one lazily if needed.
+        
+        Returns:
+            aiohttp client session kept alive across fetches
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._client_timeout,
+                # Cache DNS for an hour and keep idle connections around
+                # as long as typical CDN edges do
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=4,
+                    ttl_dns_cache=3600,
+                    enable_cleanup_closed=True,
+                    force_close=False,
+                    keepalive_timeout=75,
+                ),
+            )
+            self._owns_session = True
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP session if it was created by this scraper."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._owns_session:
+            self._session = None
     
     async def fetch_page(self) -> Optional[str]:
         """
         Fetch the HTML content from the cinema URL.
         
+        Sends the validators of the last page get_films() parsed, so an
+        unchanged page is answered with 304 Not Modified and no body. The
+        validators of this response are not kept.
+        
         Returns:
-            HTML content as string, or None if failed
+            HTML content as string, or None if failed or not modified
         """
+        fetched = await self._fetch_body()
+        if fetched is None:
+            return None
+        body, charset, _, _ = fetched
+        return self._decode(body, charset)
+    
+    async def _fetch_body(self) -> Optional[Tuple[bytes, str, Optional[str], Optional[str]]]:
+        """
+        Fetch the raw page body, sending the validators of the last parse.
+        
+        The validators of the response are only returned, not stored: they
+        must not be sent back until the body they describe has been parsed.
+        
+        Returns:
+            Tuple of body bytes, charset, ETag and Last-Modified, or None if
+            failed or not modified
+        """
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+        
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.get(self.cinema_url) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        print(f"HTTP Error: {response.status}")
-                        return None
+            session = await self._get_session()
+            async with session.get(self.cinema_url, headers=headers,
+                                   timeout=self._client_timeout) as response:
+                if response.status == 304:
+                    return None
+                elif response.status == 200:
+                    body = await response.read()
+                    return (
+                        body,
+                        response.charset or 'utf-8',
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                    )
+                else:
+                    _LOGGER.error("HTTP Error: %s", response.status)
+                    return None
         except Exception as e:
-            print(f"Error fetching page: {e}")
+            _LOGGER.error("Error fetching page: %s", e)
             return None
     
+    def _decode(self, body: bytes, charset: str) -> str:
+        """
+        Decode a page body once, with the declared charset.
+        
+        helios.pl serves UTF-8, so there is no need to let aiohttp sniff the
+        encoding of the body.
+        
+        Args:
+            body: Raw body bytes
+            charset: Charset declared by the response
+            
+        Returns:
+            HTML content as string
+        """
+        return body.decode(charset, errors='replace')
+    
     def extract_films_from_html(self, html: str) -> List[Dict]:
         """
         Extract film information from HTML content.
@@ -56,7 +436,8 @@ class HeliosScraper:
         Returns:
             List of dictionaries containing film information
         """
-        films = []
+        if not html:
+            return []
         
         # Try JavaScript extraction first (NUXT data)
         nuxt_films = self._extract_from_nuxt_data(html)
@@ -81,105 +462,44 @@ class HeliosScraper:
         
         try:
             # Find the NUXT script tag with the data
-            patterns = [
-                r'<script>window\.__NUXT__=\(function\([^)]+\)\{[^}]*\}\)\(([^)]+)\);</script>',
-                r'window\.__NUXT__=\(function\([^)]+\)\{[^}]*\}\)\(([^)]+)\);',
-                r'__NUXT__=\(function\([^)]+\)\{[^}]*\}\)\(([^)]+)\)',
-            ]
-            
-            match = None
-            for pattern in patterns:
-                match = re.search(pattern, html, re.DOTALL)
-                if match:
-                    break
-            
-            if not match:
+            start = html.find(_NUXT_MARKER)
+            if start < 0:
                 return []
+            end = html.find('</script>', start)
+            if end < 0:
+                end = len(html)
             
-            # Extract the parameters
-            params_str = match.group(1)
-            
-            # Look for movie titles in quotes with specific keywords
-            title_pattern = r'"([^"]*(?:Superman|Basia|Smerfy|Harry Potter|Jurassic|Fantastyczna|Koszmar|Lilo|Caravaggio|Brzydka|Andrea|Heidi|Grobowiec|Dziewczyna|Wujek|André|BTS|Maraton|Festiwal|Strażak|Bing|Elio|Jak wytresować|Władca Pierścieni|F1|13 dni)[^"]*)"'
-            title_matches = re.findall(title_pattern, params_str, re.IGNORECASE)
+            state = _NuxtPayload(html[start:end]).evaluate()
             
-            # Find showtime patterns - more flexible patterns
-            showtime_patterns = [
-                r'"(2025-07-\d{2} \d{2}:\d{2}:\d{2})"',  # Today's date format
-                r'"(2025-\d{2}-\d{2} \d{2}:\d{2}:\d{2})"',  # General date format
-                r'(\d{2}:\d{2}:\d{2})',  # Just time format
-                r'timeFrom["\s]*:["\s]*["\s]*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})',  # NUXT timeFrom pattern
-            ]
-            
-            showtime_matches = []
-            for pattern in showtime_patterns:
-                matches = re.findall(pattern, params_str)
-                showtime_matches.extend(matches)
+            # Movies carry their screenings; screenings carry their movie.
+            # Dict insertion order keeps the page's own ordering of movies.
+            movies: Dict[str, Dict[str, None]] = {}
+            for node in _iter_dicts(state):
+                title = node.get('title') if 'premiereDate' in node else None
+                screenings = node.get('screenings') or []
+                if title is None and 'timeFrom' in node and isinstance(node.get('movie'), dict):
+                    title = node['movie'].get('title')
+                    screenings = [node]
+                
+                if not isinstance(title, str) or not _is_valid_title(title):
+                    continue
+                
+                # Showtimes as an insertion-ordered set of HH:MM strings
+                showtimes = movies.setdefault(title, {})
+                # The regex validates the format, so no exception handling per item
+                for screening in screenings:
+                    showtime = screening.get('timeFrom') if isinstance(screening, dict) else None
+                    match = _DATE_TIME_RE.match(showtime) if isinstance(showtime, str) else None
+                    if match:
+                        showtimes[match.group(1)] = None
             
-            # Clean up titles and group showtimes by movie
-            movie_titles = set()
-            movie_showtimes_map = {}
-            # Try to group showtimes by movie title context in params_str
-            # Find all blocks like: title...showtimes... (naive, but works for this structure)
-            movie_blocks = re.findall(r'("([^"]{5,100}?)"[^{\[]*?(?:2025-\d{2}-\d{2} \d{2}:\d{2}:\d{2}[^"]*)+)', params_str)
-            for block, title in movie_blocks:
-                # Filter out paths and unwanted strings
-                if (len(title) > 5 and len(title) < 100 and 
-                    not title.startswith('film/') and 
-                    not title.startswith('wydarzenie/') and
-                    not title.endswith('.jpg') and
-                    not title.endswith('.jpeg') and
-                    not title.endswith('.png') and
-                    ' ' in title and
-                    not any(bad in title.lower() for bad in ['plakat', 'duzy-obraz', 'poster', 'banner', 'slug'])):
-                    movie_titles.add(title)
-                    # Find all showtimes in this block
-                    showtimes = []
-                    for showtime in re.findall(r'(2025-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', block):
-                        try:
-                            time_part = showtime.split(' ')[1][:5]
-                            if time_part not in showtimes:
-                                showtimes.append(time_part)
-                        except:
-                            pass
-                    movie_showtimes_map[title] = showtimes
-
-            # Fallback: if no blocks found, use previous logic
-            if not movie_titles:
-                for title in title_matches:
-                    if (len(title) > 5 and len(title) < 100 and 
-                        not title.startswith('film/') and 
-                        not title.startswith('wydarzenie/') and
-                        not title.endswith('.jpg') and
-                        not title.endswith('.jpeg') and
-                        not title.endswith('.png') and
-                        ' ' in title and
-                        not any(bad in title.lower() for bad in ['plakat', 'duzy-obraz', 'poster', 'banner', 'slug'])):
-                        movie_titles.add(title)
-                        movie_showtimes_map[title] = []
-                # Try to assign showtimes globally if found
-                showtimes = []
-                for showtime in showtime_matches[:50]:
-                    try:
-                        if ' ' in showtime:
-                            time_part = showtime.split(' ')[1][:5]
-                        else:
-                            time_part = showtime[:5]
-                        if ':' in time_part and len(time_part) >= 5:
-                            if time_part not in showtimes:
-                                showtimes.append(time_part)
-                    except:
-                        pass
-                for title in movie_titles:
-                    movie_showtimes_map[title] = showtimes[:3]
-
             # Create film objects
-            for i, title in enumerate(sorted(movie_titles)):
+            for title, showtimes in movies.items():
                 film = {
                     'title': title,
                     'description': f'Film dostępny w kinie Helios. {title}',
-                    'image': f'https://img.helios.pl/pliki/film/{self._slugify(title)}/poster.jpg',
-                    'showtimes_today': movie_showtimes_map.get(title, []),
+                    'image': f'https://img.helios.pl/pliki/film/{_slugify(title)}/poster.jpg',
+                    'showtimes_today': list(showtimes),
                     'showtimes_tomorrow': []
                 }
                 films.append(film)
@@ -187,7 +507,7 @@ class HeliosScraper:
                     break
             
         except Exception as e:
-            print(f"Error extracting from NUXT data: {e}")
+            _LOGGER.error("Error extracting from NUXT data: %s", e)
         
         return films
     
@@ -204,74 +524,126 @@ class HeliosScraper:
         films = []
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            # The NUXT state script is a large blob of JS with no markup the
+            # fallback could use; leave it out of the parse below
+            nuxt_start = html.find(_NUXT_MARKER)
+            if nuxt_start >= 0:
+                nuxt_end = html.find('</script>', nuxt_start)
+                html = html[:nuxt_start] + (html[nuxt_end:] if nuxt_end >= 0 else '')
             
-            # Look for movie titles in various HTML elements
-            title_selectors = [
-                'h2, h3, h4',  # Common heading selectors
-                '.movie-title, .film-title',  # Common CSS classes
-                '[data-title]',  # Data attributes
-            ]
+            # The first 10 distinct titles in page order, as on the NUXT path;
+            # the parse below stops as soon as it has collected that many.
+            # Dict keys keep insertion order and drop duplicates.
+            movie_titles: Dict[str, None] = {}
             
-            movie_titles = set()
-            
-            for selector in title_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text(strip=True)
-                    if (len(text) > 5 and len(text) < 100 and 
-                        any(keyword in text.lower() for keyword in [
-                            'superman', 'basia', 'smerfy', 'harry', 'film', 'maraton'
-                        ])):
-                        movie_titles.add(text)
+            # Stream-parse the page only if it has any markup the title
+            # elements could come from
+            if any(marker in html for marker in _FALLBACK_MARKERS):
+                # Number of title elements currently open; their subtrees are
+                # kept until the title text is read, everything else is freed
+                open_titles = 0
+                for event, element in _iter_html_events(html):
+                    is_title = _is_title_element(element)
+                    if event == 'start':
+                        open_titles += is_title
+                        continue
+                    
+                    if is_title:
+                        open_titles -= 1
+                        text = ''.join(part.strip() for part in element.itertext())
+                        if _is_fallback_title(text):
+                            movie_titles[text] = None
+                            if len(movie_titles) >= 10:
+                                break
+                    
+                    if not open_titles:
+                        element.clear(keep_tail=True)
+                        while element.getprevious() is not None:
+                            del element.getparent()[0]
             
             # Create basic film objects
-            for title in sorted(movie_titles):
+            for title in movie_titles:
                 film = {
                     'title': title,
                     'description': f'Film dostępny w kinie Helios. {title}',
-                    'image': f'https://img.helios.pl/pliki/film/{self._slugify(title)}/poster.jpg',
+                    'image': f'https://img.helios.pl/pliki/film/{_slugify(title)}/poster.jpg',
                     'showtimes_today': [],
                     'showtimes_tomorrow': []
                 }
                 films.append(film)
-                
-                if len(films) >= 10:  # Limit to 10 movies
-                    break
             
         except Exception as e:
-            print(f"Error in HTML fallback extraction: {e}")
+            _LOGGER.error("Error in HTML fallback extraction: %s", e)
         
         return films
     
-    def _slugify(self, text: str) -> str:
+    def _parse_body(self, body: bytes, charset: str) -> List[Dict]:
         """
-        Convert text to URL-friendly slug.
+        Decode a page body and extract its films; runs in a worker thread.
         
         Args:
-            text: Text to convert
+            body: Raw body bytes
+            charset: Charset declared by the response
             
         Returns:
-            URL-friendly slug
+            List of film dictionaries
         """
-        # Basic slugify implementation
-        slug = text.lower()
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        slug = re.sub(r'[\s-]+', '-', slug)
-        return slug.strip('-')
+        return self.extract_films_from_html(self._decode(body, charset))
+    
+    @property
+    def cache(self) -> Dict[str, Any]:
+        """
+        Snapshot of the HTTP validators and films, suitable for persisting.
+        
+        Returns:
+            JSON-serializable dictionary
+        """
+        return {
+            'etag': self._etag,
+            'last_modified': self._last_modified,
+            'films': self._films,
+        }
+    
+    def restore_cache(self, cache: Dict[str, Any]) -> None:
+        """
+        Restore state saved from the cache property, e.g. after a restart.
+        
+        Args:
+            cache: Dictionary previously returned by the cache property
+        """
+        self._etag = cache.get('etag')
+        self._last_modified = cache.get('last_modified')
+        self._films = cache.get('films') or []
     
     async def get_films(self) -> List[Dict]:
         """
         Main method to get films from the cinema.
         
+        If the page cannot be fetched, the films from the last successful
+        fetch (or restored cache) are returned instead of an empty list.
+        
         Returns:
             List of film dictionaries with titles, descriptions, images, and showtimes
         """
-        html = await self.fetch_page()
-        if not html:
-            return []
+        fetched = await self._fetch_body()
+        # Not modified, or the fetch failed: serve the last known films
+        if not fetched or not fetched[0]:
+            return self._films
+        body, charset, etag, last_modified = fetched
         
-        return self.extract_films_from_html(html)
+        # Identical page content: reuse the films parsed last time. The raw
+        # bytes are hashed, so an unchanged page is never decoded at all.
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest != self._html_digest:
+            # Decoding and parsing are CPU-bound; keep both off the event loop
+            self._films = await asyncio.to_thread(self._parse_body, body, charset)
+            self._html_digest = digest
+        
+        # Only now that the films describe this body may its validators be
+        # sent back; a failed read or parse must not earn a 304 next time
+        self._etag = etag
+        self._last_modified = last_modified
+        return self._films
 
 
 def extract_films_from_file(file_path: str) -> List[Dict]:
@@ -292,7 +664,7 @@ def extract_films_from_file(file_path: str) -> List[Dict]:
         return scraper.extract_films_from_html(html)
     
     except Exception as e:
-        print(f"Error reading file {file_path}: {e}")
+        _LOGGER.error("Error reading file %s: %s", file_path, e)
         return []
 
 
@@ -300,7 +672,10 @@ def extract_films_from_file(file_path: str) -> List[Dict]:
 if __name__ == "__main__":
     async def main():
         scraper = HeliosScraper("https://helios.pl/wroclaw/kino-helios-magnolia")
-        films = await scraper.get_films()
+        try:
+            films = await scraper.get_films()
+        finally:
+            await scraper.close()
         
         print(f"Found {len(films)} films:")
         for i, film in enumerate(films, 1):
@@ -2,20 +2,18 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
-from .scraper import HeliosScraper
+from . import HeliosCinemaCoordinator
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.util import Throttle
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=30)
-
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -29,20 +27,29 @@ async def async_setup_platform(
     update_interval = cinema_config.get("update_interval", 30)
     cinema_name = cinema_config.get("cinema_name", "Helios Cinema")
     
-    sensor = HeliosCinemaSensor(cinema_url, update_interval, cinema_name)
-    async_add_entities([sensor], True)
+    coordinator = HeliosCinemaCoordinator(hass, [cinema_url], update_interval)
+    await coordinator.async_refresh()
+    
+    sensor = HeliosCinemaSensor(coordinator, cinema_url, cinema_name)
+    async_add_entities([sensor])
 
 
-class HeliosCinemaSensor(SensorEntity):
+class HeliosCinemaSensor(CoordinatorEntity[HeliosCinemaCoordinator], SensorEntity):
     """Representation of a Helios Cinema sensor."""
 
-    def __init__(self, cinema_url: str, update_interval: int, cinema_name: str) -> None:
+    def __init__(
+        self,
+        coordinator: HeliosCinemaCoordinator,
+        cinema_url: str,
+        cinema_name: str,
+    ) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
         self._cinema_url = cinema_url
-        self._update_interval = update_interval
         self._cinema_name = cinema_name
-        self._state = None
-        self._films = []
+        self._films = (coordinator.data or {}).get(cinema_url, [])
+        self._last_updated_iso = datetime.now().isoformat()
+        self._attrs = self._build_attributes()
         
         # Extract cinema location from URL for unique naming
         url_parts = cinema_url.split('/')
@@ -56,6 +63,15 @@ class HeliosCinemaSensor(SensorEntity):
         self._attr_unique_id = f"helios_cinema_films_{location}"
         self._attr_icon = "mdi:movie"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take this cinema's films from the coordinator's latest poll."""
+        self._films = (self.coordinator.data or {}).get(self._cinema_url, [])
+        self._last_updated_iso = datetime.now().isoformat()
+        self._attrs = self._build_attributes()
+        _LOGGER.debug("Updated films: %s films found", len(self._films))
+        super()._handle_coordinator_update()
+
     @property
     def state(self) -> str | None:
         """Return the state of the sensor."""
@@ -64,33 +80,13 @@ class HeliosCinemaSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        return self._attrs
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the state attributes once per update."""
         return {
             "films": self._films,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": self._last_updated_iso,
             "cinema_url": self._cinema_url,
             "cinema_name": self._cinema_name,
         }
-
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        try:
-            films = await self._fetch_films()
-            self._films = films
-            _LOGGER.debug(f"Updated films: {len(films)} films found")
-        except Exception as err:
-            _LOGGER.error(f"Error updating Helios Cinema data: {err}")
-            self._films = []
-
-    async def _fetch_films(self) -> list[dict[str, Any]]:
-        """Fetch films from Helios website using the new scraper."""
-        try:
-            scraper = HeliosScraper(self._cinema_url, timeout=30)
-            films = await scraper.get_films()
-            _LOGGER.debug(f"Scraper found {len(films)} films")
-            return films
-        except Exception as err:
-            _LOGGER.error(f"Error fetching films with scraper: {err}")
-            return []
-
-
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for the Helios Cinema scraper, run offline against tests/test_page.html.
+"""
+
+import os
+import sys
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Import the scraper module directly; the package __init__ needs Home Assistant
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'custom_components', 'helios_cinema'))
+
+from scraper import HeliosScraper, extract_films_from_file  # noqa: E402
+
+TEST_PAGE = os.path.join(TESTS_DIR, 'test_page.html')
+
+# Movies in the order the NUXT state lists them on the sample page
+EXPECTED_TITLES = [
+    'Superman',
+    'Basia. Mam swój świat',
+    'Smerfy. Wielki film',
+    'Jurassic World: Odrodzenie',
+    'F1',
+    'Jak wytresować smoka',
+    'Lilo i Stitch',
+    'Elio',
+    'Heidi ratuje rysia',
+    'Brzydka siostra',
+    'Fantastyczna 4: Pierwsze kroki',
+    'Koszmar minionego lata',
+    'Oddaj ją',
+    'Pan Wilk i spółka 2',
+    'Naga broń',
+]
+
+# First 10 fallback titles on the sample page, in page order
+EXPECTED_FALLBACK_TITLES = [
+    'Superman',
+    'Basia. Mam swój świat',
+    'Filmowe Poranki: Strażak Sam, cz. 5',
+    'Maraton Władcy Pierścieni',
+    'Harry Potter: Mini Maraton cz. 3-4',
+    'Harry Potter: Mini Maraton cz. 5-6',
+    'Filmowe Poranki: Bing, cz. 5',
+    'Maraton Horrorów',
+    'Harry Potter: Mini Maraton cz. 7-8',
+    'Smerfy. Wielki film',
+]
+
+# A well-formed payload and its variants the evaluator must reject
+NUXT_PAYLOAD = (
+    '<script>window.__NUXT__=(function(a,b,c){a.timeFrom="2025-07-18 19:30:00";'
+    'return {data:[{title:c,premiereDate:b,screenings:[a]}]}}'
+    '({},"2025-07-10","Superman"));</script>'
+)
+NUXT_UNKNOWN_TOKEN = NUXT_PAYLOAD.replace('premiereDate:b', 'premiereDate:!0')
+NUXT_OUTER_CALL = NUXT_PAYLOAD.replace('}}({},', '}})({},').replace('));', ');')
+FALLBACK_HTML = '<h2><a href="/film/smerfy">Smerfy. Wielki film</a></h2>'
+
+
+class TestNuxtExtraction(unittest.TestCase):
+    """Extraction from the evaluated window.__NUXT__ payload."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.films = extract_films_from_file(TEST_PAGE)
+
+    def test_titles_in_page_order(self):
+        self.assertEqual([film['title'] for film in self.films], EXPECTED_TITLES)
+
+    def test_showtimes(self):
+        superman = self.films[0]
+        self.assertEqual(superman['showtimes_today'], ['19:30', '21:10'])
+        self.assertEqual(superman['showtimes_tomorrow'], [])
+
+    def test_image_slug(self):
+        basia = self.films[1]
+        self.assertEqual(
+            basia['image'],
+            'https://img.helios.pl/pliki/film/basia-mam-swoj-swiat/poster.jpg',
+        )
+
+    def test_synthetic_payload(self):
+        films = HeliosScraper('dummy_url')._extract_from_nuxt_data(NUXT_PAYLOAD)
+        self.assertEqual([film['title'] for film in films], ['Superman'])
+        self.assertEqual(films[0]['showtimes_today'], ['19:30'])
+
+
+class TestMalformedPayload(unittest.TestCase):
+    """Payloads the evaluator does not understand fall through to the HTML fallback."""
+
+    def setUp(self):
+        self.scraper = HeliosScraper('dummy_url')
+
+    def assert_falls_back(self, payload):
+        with self.assertLogs('scraper', level='ERROR'):
+            self.assertEqual(self.scraper._extract_from_nuxt_data(payload), [])
+        with self.assertLogs('scraper', level='ERROR'):
+            films = self.scraper.extract_films_from_html(payload + FALLBACK_HTML)
+        self.assertEqual([film['title'] for film in films], ['Smerfy. Wielki film'])
+
+    def test_unknown_token(self):
+        self.assert_falls_back(NUXT_UNKNOWN_TOKEN)
+
+    def test_outer_call_form(self):
+        self.assert_falls_back(NUXT_OUTER_CALL)
+
+
+class TestHtmlFallback(unittest.TestCase):
+    """Extraction from headings and title elements when there is no NUXT data."""
+
+    def test_nested_heading_text(self):
+        films = HeliosScraper('dummy_url').extract_films_from_html(FALLBACK_HTML)
+        self.assertEqual([film['title'] for film in films], ['Smerfy. Wielki film'])
+
+    def test_sample_page_without_nuxt(self):
+        with open(TEST_PAGE, encoding='utf-8') as f:
+            html = f.read()
+        films = HeliosScraper('dummy_url')._extract_from_html_fallback(html)
+        self.assertEqual([film['title'] for film in films], EXPECTED_FALLBACK_TITLES)
+
+    def test_empty_page(self):
+        self.assertEqual(HeliosScraper('dummy_url').extract_films_from_html(''), [])
+
+
+class TestHttpCaching(unittest.IsolatedAsyncioTestCase):
+    """Conditional GETs, unchanged bodies and failures against a local server."""
+
+    async def asyncSetUp(self):
+        with open(TEST_PAGE, 'rb') as f:
+            self.page = f.read()
+        # What the server answers with; tests change these between polls
+        self.body = self.page
+        self.etag = '"v1"'
+        self.status = 200
+        self.charset = 'utf-8'
+        self.requests = []
+
+        app = web.Application()
+        app.router.add_get('/', self.handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.scraper = HeliosScraper(str(self.server.make_url('/')), timeout=5)
+
+    async def asyncTearDown(self):
+        await self.scraper.close()
+        await self.server.close()
+
+    async def handle(self, request):
+        self.requests.append(request.headers.get('If-None-Match'))
+        if self.status != 200:
+            return web.Response(status=self.status)
+        if request.headers.get('If-None-Match') == self.etag:
+            return web.Response(status=304)
+        return web.Response(body=self.body, headers={
+            'ETag': self.etag,
+            'Content-Type': f'text/html; charset={self.charset}',
+        })
+
+    async def test_not_modified(self):
+        films = await self.scraper.get_films()
+        self.assertEqual([film['title'] for film in films], EXPECTED_TITLES)
+        self.assertIs(await self.scraper.get_films(), films)
+        self.assertEqual(self.requests, [None, '"v1"'])
+
+    async def test_unchanged_body_is_not_parsed_again(self):
+        films = await self.scraper.get_films()
+        digest = self.scraper._html_digest
+        # Same bytes under a new validator
+        self.etag = '"v2"'
+        self.assertIs(await self.scraper.get_films(), films)
+        self.assertEqual(self.scraper._html_digest, digest)
+        self.assertEqual(self.scraper._etag, '"v2"')
+
+    async def test_server_error_serves_previous_films(self):
+        films = await self.scraper.get_films()
+        self.status = 500
+        with self.assertLogs('scraper', level='ERROR'):
+            self.assertIs(await self.scraper.get_films(), films)
+
+    async def test_failed_parse_keeps_validators(self):
+        films = await self.scraper.get_films()
+        # A changed page that cannot be decoded
+        self.body = NUXT_PAYLOAD.encode('utf-8')
+        self.etag = '"v2"'
+        self.charset = 'bogus-charset'
+        with self.assertRaises(LookupError):
+            await self.scraper.get_films()
+        self.assertEqual(self.scraper._etag, '"v1"')
+        self.assertIs(self.scraper._films, films)
+
+        # The next poll must fetch the new page in full, not get a 304
+        self.charset = 'utf-8'
+        films = await self.scraper.get_films()
+        self.assertEqual([film['title'] for film in films], ['Superman'])
+        self.assertEqual(self.scraper._etag, '"v2"')
+        self.assertEqual(self.requests, [None, '"v1"', '"v1"'])
+
+
+if __name__ == '__main__':
+    unittest.main()